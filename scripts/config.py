@@ -359,13 +359,18 @@ class ConfigFile(Config):
                            r'(?P<separator>\s*)' +
                            r'(?P<value>.*)')
     _section_line_regexp = (r'\s*/?\*+\s*[\\@]name\s+SECTION:\s*' +
-                            r'(?P<section>.*)[ */]*')
+                            r'(?P<section>.*)')
     _config_line_regexp = re.compile(r'|'.join([_define_line_regexp,
                                                 _section_line_regexp]))
     def _parse_line(self, line):
         """Parse a line in mbedtls_config.h and return the corresponding template."""
         line = line.rstrip('\r\n')
-        m = re.match(self._config_line_regexp, line)
+        # Most lines are comments. Skip the regex unless the line contains
+        # something that _define_line_regexp or _section_line_regexp
+        # requires.
+        if '#' not in line and 'SECTION:' not in line:
+            return line
+        m = self._config_line_regexp.match(line)
         if m is None:
             return line
         elif m.group('section'):
@@ -407,14 +412,17 @@ class ConfigFile(Config):
                         middle,
                         value]).rstrip()
 
+    def _format_line(self, template):
+        """Build the line for mbedtls_config.h corresponding to template."""
+        if isinstance(template, str):
+            return template
+        else:
+            return self._format_template(*template)
+
     def write_to_stream(self, output):
         """Write the whole configuration to output."""
-        for template in self.templates:
-            if isinstance(template, str):
-                line = template
-            else:
-                line = self._format_template(*template)
-            output.write(line + '\n')
+        output.write(''.join(self._format_line(template) + '\n'
+                             for template in self.templates))
 
     def write(self, filename=None):
         """Write the whole configuration to the file it was read from.